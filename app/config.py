@@ -1,34 +1,57 @@
+import hashlib
 import os
+from dataclasses import dataclass, field
 from dotenv import load_dotenv
 
 # Load environment variables from .env file
 load_dotenv()
 
+@dataclass(frozen=True, slots=True)
 class Settings:
-     # BigQuery Configuration
+    # BigQuery Configuration
     GOOGLE_CLOUD_PROJECT: str = os.getenv("GOOGLE_CLOUD_PROJECT", "")
     BIGQUERY_DATASET: str = os.getenv("BIGQUERY_DATASET", "crypto_tracker")
     BIGQUERY_TABLE: str = os.getenv("BIGQUERY_TABLE", "smart_wallets")
+    BIGQUERY_STATS_TABLE: str = os.getenv("BIGQUERY_STATS_TABLE", "wallet_stats")
     GOOGLE_APPLICATION_CREDENTIALS: str = os.getenv("GOOGLE_APPLICATION_CREDENTIALS", "")
-    
-    # Full table reference
-    @property
-    def FULL_TABLE_ID(self) -> str:
-        return f"{self.GOOGLE_CLOUD_PROJECT}.{self.BIGQUERY_DATASET}.{self.BIGQUERY_TABLE}"
-    
+
+    # Full table references, computed once instead of re-formatted per access
+    FULL_TABLE_ID: str = field(init=False, default="")
+    FULL_STATS_TABLE_ID: str = field(init=False, default="")
 
     # API Configuration
     API_HOST: str = os.getenv("API_HOST", "0.0.0.0")
     API_PORT: int = int(os.getenv("API_PORT", "8000"))
     DEBUG: bool = os.getenv("DEBUG", "False").lower() == "true"
     ADMIN_PASSWORD: str = os.getenv("ADMIN_PASSWORD", "Password!!")
-    
+
+    # SHA-256 digest of ADMIN_PASSWORD, computed once so login compares
+    # fixed-size byte digests instead of the plaintext string
+    ADMIN_PASSWORD_HASH: bytes = field(init=False, default=b"")
+
     # CORS Configuration
-    ALLOWED_ORIGINS: list = os.getenv("ALLOWED_ORIGINS", "*").split(",")
-    
+    ALLOWED_ORIGINS: list = field(default_factory=lambda: os.getenv("ALLOWED_ORIGINS", "*").split(","))
+
     # API Metadata
     API_TITLE: str = "Wallet Management API"
-    API_DESCRIPTION: str = "API for managing wallet entries with scores using MongoDB"
+    API_DESCRIPTION: str = "API for managing wallet entries with scores using BigQuery"
     API_VERSION: str = "1.0.0"
 
-settings = Settings()
\ No newline at end of file
+    def __post_init__(self):
+        object.__setattr__(
+            self,
+            "FULL_TABLE_ID",
+            f"{self.GOOGLE_CLOUD_PROJECT}.{self.BIGQUERY_DATASET}.{self.BIGQUERY_TABLE}"
+        )
+        object.__setattr__(
+            self,
+            "FULL_STATS_TABLE_ID",
+            f"{self.GOOGLE_CLOUD_PROJECT}.{self.BIGQUERY_DATASET}.{self.BIGQUERY_STATS_TABLE}"
+        )
+        object.__setattr__(
+            self,
+            "ADMIN_PASSWORD_HASH",
+            hashlib.sha256(self.ADMIN_PASSWORD.encode()).digest()
+        )
+
+settings = Settings()
@@ -1,31 +1,134 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import Annotated
+from fastapi import Depends
+from google.auth.transport.requests import AuthorizedSession
 from google.cloud import bigquery
 from google.cloud.exceptions import NotFound
+from requests.adapters import HTTPAdapter
 from .config import settings
+import asyncio
+import functools
+import google.auth
 import logging
+import os
+import tempfile
+import time
 
 logger = logging.getLogger(__name__)
 
+# Sentinel file marking that dataset/table setup already ran on this host,
+# so warm restarts can skip the metadata RPCs. Re-verified once a day.
+_READY_SENTINEL_MAX_AGE = 24 * 60 * 60
+
+def _ready_sentinel_path():
+    name = f".bq_ready_{settings.GOOGLE_CLOUD_PROJECT}_{settings.BIGQUERY_DATASET}_{settings.BIGQUERY_TABLE}"
+    return os.path.join(tempfile.gettempdir(), name)
+
+def _table_recently_verified():
+    try:
+        return time.time() - os.path.getmtime(_ready_sentinel_path()) < _READY_SENTINEL_MAX_AGE
+    except OSError:
+        return False
+
+def _mark_table_verified():
+    try:
+        with open(_ready_sentinel_path(), "w"):
+            pass
+    except OSError:
+        # Purely an optimization; never fail startup over the sentinel
+        pass
+
 class Database:
     client: bigquery.Client = None
+    storage_client = None
 
 # Global database instance
 database = Database()
 
+# Dedicated pool for blocking BigQuery calls; keeps query roundtrips off the
+# event loop's small default executor so concurrent requests don't starve it
+BQ_EXECUTOR = ThreadPoolExecutor(max_workers=32, thread_name_prefix="bq")
+
+# HTTP connections kept alive to BigQuery. The transport default is 10;
+# with up to 32 executor threads in flight the rest would block on socket
+# checkout, so size the pool above the executor with some headroom.
+_HTTP_POOL_SIZE = 50
+
+def _build_client() -> bigquery.Client:
+    """BigQuery client over a session with an explicitly sized connection pool"""
+    try:
+        credentials, default_project = google.auth.default()
+        session = AuthorizedSession(credentials)
+        adapter = HTTPAdapter(pool_connections=_HTTP_POOL_SIZE, pool_maxsize=_HTTP_POOL_SIZE)
+        session.mount("https://", adapter)
+        return bigquery.Client(
+            project=settings.GOOGLE_CLOUD_PROJECT or default_project,
+            credentials=credentials,
+            _http=session,
+        )
+    except Exception as e:
+        logger.warning(f"Falling back to default BigQuery transport: {e}")
+        return bigquery.Client(project=settings.GOOGLE_CLOUD_PROJECT)
+
+@functools.lru_cache(maxsize=1)
+def get_wallets_table() -> bigquery.Table:
+    """Wallets table metadata, fetched once per process for streaming inserts"""
+    return database.client.get_table(settings.FULL_TABLE_ID)
+
+async def run_query(client: bigquery.Client, query: str, job_config=None):
+    """Run a blocking BigQuery query on the dedicated pool, return its rows"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        BQ_EXECUTOR,
+        lambda: list(client.query(query, job_config=job_config).result())
+    )
+
+async def run_dml(client: bigquery.Client, query: str, job_config=None):
+    """Run a blocking DML statement on the pool, return the completed job
+
+    Callers need the job itself (num_dml_affected_rows) rather than rows,
+    so this is the write-side counterpart of run_query.
+    """
+    def _run():
+        job = client.query(query, job_config=job_config)
+        job.result()
+        return job
+
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(BQ_EXECUTOR, _run)
+
 async def connect_to_bigquery():
     """Create BigQuery client and ensure table exists"""
     try:
-        database.client = bigquery.Client(project=settings.GOOGLE_CLOUD_PROJECT)
-        
+        database.client = _build_client()
+        get_wallets_table.cache_clear()
+
+        # Storage Read API client for fast columnar (Arrow) result downloads
+        try:
+            from google.cloud import bigquery_storage
+            database.storage_client = bigquery_storage.BigQueryReadClient()
+        except Exception as e:
+            logger.warning(f"BigQuery Storage API unavailable, falling back to REST: {e}")
+            database.storage_client = None
+
+
         # Test connection
         query = f"SELECT 1 as test LIMIT 1"
         list(database.client.query(query))
         
-        # Ensure dataset exists
-        await ensure_dataset_exists()
-        
-        # Ensure table exists with proper schema
-        await ensure_table_exists()
-        
+        # Ensure dataset and table exist; skip the metadata RPCs on warm
+        # restarts where this host verified them recently
+        if _table_recently_verified():
+            logger.info(f"Skipping dataset/table checks for {settings.FULL_TABLE_ID} (verified recently)")
+        else:
+            await ensure_dataset_exists()
+            await ensure_table_exists()
+            await ensure_stats_table_exists()
+            _mark_table_verified()
+
+        # Warm up the client so the first real request doesn't pay for it
+        await warm_connection_pool()
+
         logger.info(f"Connected to BigQuery: {settings.FULL_TABLE_ID}")
         
     except Exception as e:
@@ -61,14 +164,108 @@ async def ensure_table_exists():
         ]
         
         table = bigquery.Table(settings.FULL_TABLE_ID, schema=schema)
+
+        # Partition by creation day and cluster on the lookup/filter columns
+        # so point lookups and score filters scan a fraction of the table.
+        # address and id cover the WHERE-clause lookups; is_active/score
+        # serve the list filters
+        table.time_partitioning = bigquery.TimePartitioning(field="created_at")
+        table.clustering_fields = ["address", "id", "is_active", "score"]
+
+        database.client.create_table(table)
+
+async def ensure_stats_table_exists():
+    """Create the wallet_stats counter table if it doesn't exist
+
+    Holds one row per counter (currently just the wallet total) so reads
+    don't need a COUNT(*) scan of the wallets table. Seeded from the real
+    count at creation; the write handlers keep it incremented/decremented.
+    """
+    try:
+        database.client.get_table(settings.FULL_STATS_TABLE_ID)
+        logger.info(f"Table {settings.FULL_STATS_TABLE_ID} already exists")
+    except NotFound:
+        logger.info(f"Creating table {settings.FULL_STATS_TABLE_ID}")
+
+        schema = [
+            bigquery.SchemaField("name", "STRING", mode="REQUIRED"),
+            bigquery.SchemaField("total", "INTEGER", mode="REQUIRED"),
+        ]
+
+        table = bigquery.Table(settings.FULL_STATS_TABLE_ID, schema=schema)
         database.client.create_table(table)
 
+        seed_query = f"""
+            INSERT INTO `{settings.FULL_STATS_TABLE_ID}` (name, total)
+            SELECT 'wallets', COUNT(*) FROM `{settings.FULL_TABLE_ID}`
+        """
+        database.client.query(seed_query).result()
+
+async def reconcile_wallet_stats():
+    """Recompute the wallet total from COUNT(*) to heal any counter drift
+
+    Not on any request path; run hourly by the lifespan task below, and
+    safe to call manually.
+    """
+    query = f"""
+        UPDATE `{settings.FULL_STATS_TABLE_ID}`
+        SET total = (SELECT COUNT(*) FROM `{settings.FULL_TABLE_ID}`)
+        WHERE name = 'wallets'
+    """
+    await asyncio.to_thread(lambda: database.client.query(query).result())
+    logger.info("Reconciled wallet_stats total")
+
+# How often the counter is recomputed from the real table. Fire-and-forget
+# counter updates can fail (BigQuery aborts concurrent DML), so drift is
+# expected and this bounds how long it lasts.
+_RECONCILE_INTERVAL = 60 * 60
+
+async def reconcile_wallet_stats_periodically():
+    """Reconcile the wallet counter hourly; started from the app lifespan"""
+    while True:
+        await asyncio.sleep(_RECONCILE_INTERVAL)
+        try:
+            await reconcile_wallet_stats()
+        except Exception as e:
+            logger.warning(f"wallet_stats reconciliation failed: {e}")
+
+async def warm_connection_pool():
+    """Prime auth token, table metadata and HTTP connections at startup
+
+    The first query after process start otherwise pays for the OAuth token
+    fetch, connection setup and table metadata roundtrips on the user's
+    request. Running a few queries in parallel here moves those one-shot
+    costs into the lifespan startup.
+    """
+    try:
+        # Prime the process-wide table-metadata cache so later callers of
+        # get_wallets_table never pay the REST roundtrip
+        get_wallets_table()
+
+        # Touch the real table once and open several connections in parallel
+        warm_query = f"SELECT id FROM `{settings.FULL_TABLE_ID}` LIMIT 1"
+        await asyncio.gather(
+            asyncio.to_thread(lambda: list(database.client.query(warm_query).result())),
+            *[
+                asyncio.to_thread(lambda: list(database.client.query("SELECT 1").result()))
+                for _ in range(3)
+            ]
+        )
+        logger.info("BigQuery connection pool warmed up")
+    except Exception as e:
+        # Warm-up is best effort; a failure here shouldn't block startup
+        logger.warning(f"BigQuery warm-up failed: {e}")
+
 async def close_bigquery_connection():
     """Close BigQuery connection"""
+    BQ_EXECUTOR.shutdown(wait=False)
     if database.client:
         database.client.close()
         logger.info("Disconnected from BigQuery")
 
 def get_client():
     """Dependency to get the BigQuery client"""
-    return database.client
\ No newline at end of file
+    return database.client
+
+# Shared annotated dependency so routes don't redeclare Depends(get_client)
+BQClient = Annotated[bigquery.Client, Depends(get_client)]
\ No newline at end of file
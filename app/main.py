@@ -1,24 +1,32 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from contextlib import asynccontextmanager
+import asyncio
 
 from .config import settings
-from .database import connect_to_bigquery, close_bigquery_connection
+from .database import connect_to_bigquery, close_bigquery_connection, reconcile_wallet_stats_periodically
 from .router import wallets_router
 from .router import frontend_router
+from .router.frontend import preload_templates
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # Startup
+    preload_templates()
     await connect_to_bigquery()
+    # Heals wallet_stats drift left by failed fire-and-forget counter updates
+    reconcile_task = asyncio.create_task(reconcile_wallet_stats_periodically())
     yield
     # Shutdown
+    reconcile_task.cancel()
     await close_bigquery_connection()
 
 app = FastAPI(
     title=settings.API_TITLE,
     description=settings.API_DESCRIPTION,
     version=settings.API_VERSION,
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
 # Add CORS middleware
@@ -61,10 +69,15 @@ async def health_check():
     return {"status": "healthy", "database": "BigQuery"}
 
 if __name__ == "__main__":
+    import os
     import uvicorn
     uvicorn.run(
         "app.main:app",
         host=settings.API_HOST,
         port=settings.API_PORT,
-        reload=settings.DEBUG
+        reload=settings.DEBUG,
+        # uvloop/httptools ship with uvicorn[standard]; request them explicitly
+        loop="uvloop",
+        http="httptools",
+        workers=1 if settings.DEBUG else os.cpu_count()
     )
\ No newline at end of file
@@ -1,3 +1,3 @@
-from .wallet import Wallet, WalletCreate, WalletUpdate
+from .wallet import Wallet, WalletCreate, WalletUpdate, WalletList
 
-__all__ = ["Wallet", "WalletCreate", "WalletUpdate"]
\ No newline at end of file
+__all__ = ["Wallet", "WalletCreate", "WalletUpdate", "WalletList"]
@@ -1,5 +1,5 @@
 from pydantic import BaseModel, Field, ConfigDict
-from typing import Optional
+from typing import List, Optional
 from datetime import datetime
 import uuid
 
@@ -16,23 +16,30 @@ class WalletUpdate(BaseModel):
     is_active: Optional[bool] = Field(None, description="Updated active status")
 
 class Wallet(WalletBase):
-    model_config = ConfigDict(
-        populate_by_name=True,
-        json_encoders={datetime: lambda v: v.isoformat()}
-    )
-    
+    model_config = ConfigDict(populate_by_name=True)
+
+
     id: str = Field(default_factory=lambda: str(uuid.uuid4()))
     created_at: datetime
     last_updated: datetime
 
     @classmethod
     def from_bigquery_row(cls, row):
-        """Create Wallet instance from BigQuery row"""
-        return cls(
+        """Create Wallet instance from BigQuery row
+
+        Values read back from the table already passed validation on the
+        way in, so model_construct skips re-running it per row.
+        """
+        return cls.model_construct(
             id=row.id,
             address=row.address,
             score=row.score,
             is_active=row.is_active,
             created_at=row.created_at,
             last_updated=row.last_updated
-        )
\ No newline at end of file
+        )
+
+class WalletList(BaseModel):
+    """Page of wallets plus the total count matching the filter"""
+    wallets: List[Wallet]
+    total_count: int
\ No newline at end of file
@@ -1,14 +1,19 @@
+import asyncio
 import base64
+import hashlib
 import os
+import secrets
 from pathlib import Path
-from fastapi import APIRouter, Form, Request, Depends, HTTPException
+from fastapi import APIRouter, Form, Request, HTTPException
 from fastapi.templating import Jinja2Templates
-from fastapi.responses import HTMLResponse, RedirectResponse
+from fastapi.responses import HTMLResponse, RedirectResponse, StreamingResponse
 import json
+import jinja2
 from google.cloud import bigquery
 
 from ..config import settings
-from ..database import get_client
+from ..database import BQClient, database, BQ_EXECUTOR, run_query
+from ..utils import get_cached_wallet_by_address, cache_wallet_by_address
 
 router = APIRouter(tags=["frontend"])
 
@@ -17,8 +22,22 @@ BASE_DIR = Path(__file__).resolve().parent.parent
 TEMPLATES_DIR = BASE_DIR / "templates"
 templates = Jinja2Templates(directory=str(TEMPLATES_DIR))
 
+# Persist compiled template bytecode across restarts and stop re-stat()ing
+# template files on every render; templates don't change at runtime
+templates.env.bytecode_cache = jinja2.FileSystemBytecodeCache()
+templates.env.auto_reload = False
+
+def preload_templates():
+    """Compile all templates at startup so first renders skip parse+compile"""
+    for name in templates.env.list_templates(extensions=["html"]):
+        templates.env.get_template(name)
+
+# Sort fields allowed in ORDER BY (interpolated into SQL, so whitelist them)
+VALID_SORT_FIELDS = {"created_at", "score", "address", "last_updated"}
+
 @router.get("/wallets", response_class=HTMLResponse)
 async def get_wallets_html(
+    client: BQClient,
     request: Request,
     active_only: bool = False,
     min_score: int = 0,
@@ -26,62 +45,67 @@ async def get_wallets_html(
     limit: int = 10,
     offset: int = 0,
     sort_by: str = "created_at",
-    sort_order: int = -1,
-    client: bigquery.Client = Depends(get_client)
+    sort_order: int = -1
 ):
     """Get wallets as HTML table"""
-    
+
     try:
-        # Build WHERE clause
-        where_conditions = [
-            f"score >= {min_score}",
-            f"score <= {max_score}"
-        ]
-        
+        # Build WHERE clause (filter values go in as query parameters so
+        # BigQuery sees the same query text and can serve cached results)
+        where_clause = "score >= @min_score AND score <= @max_score"
+
         if active_only:
-            where_conditions.append("is_active = TRUE")
-        
-        where_clause = " AND ".join(where_conditions)
-        
-        # Build ORDER BY clause
+            where_clause += " AND is_active = TRUE"
+
+        # Build ORDER BY clause (validated against a whitelist, never user input)
+        if sort_by not in VALID_SORT_FIELDS:
+            sort_by = "created_at"
         order_direction = "DESC" if sort_order == -1 else "ASC"
-        
-        # Get wallets with pagination
+
+        # Get wallets with pagination; COUNT(*) OVER () piggybacks the total
+        # row count onto the same scan so we don't need a second query job
         wallets_query = f"""
-            SELECT id, address, score, is_active, created_at, last_updated
+            SELECT id, address, score, is_active, created_at, last_updated,
+                   COUNT(*) OVER () AS total_count
             FROM `{settings.FULL_TABLE_ID}`
             WHERE {where_clause}
             ORDER BY {sort_by} {order_direction}
-            LIMIT {limit} OFFSET {offset}
+            LIMIT @limit OFFSET @offset
         """
-        
-        wallets_result = client.query(wallets_query)
-        wallets = [
-            {
-                "id": row.id,
-                "address": row.address,
-                "score": row.score,
-                "is_active": row.is_active,
-                "created_at": row.created_at,
-                "last_updated": row.last_updated
-            }
-            for row in wallets_result
-        ]
-        
-        # Get total count for pagination
-        count_query = f"""
-            SELECT COUNT(*) as total_count
-            FROM `{settings.FULL_TABLE_ID}`
-            WHERE {where_clause}
-        """
-        count_result = client.query(count_query)
-        total_count = list(count_result)[0].total_count
+
+        job_config = bigquery.QueryJobConfig(query_parameters=[
+            bigquery.ScalarQueryParameter("min_score", "INT64", min_score),
+            bigquery.ScalarQueryParameter("max_score", "INT64", max_score),
+            bigquery.ScalarQueryParameter("limit", "INT64", limit),
+            bigquery.ScalarQueryParameter("offset", "INT64", offset),
+        ])
+
+        def fetch_wallets():
+            wallets_result = client.query(wallets_query, job_config=job_config).result()
+            if database.storage_client is not None:
+                # Download the page as Arrow columnar batches instead of
+                # decoding rows one by one over REST
+                arrow_table = wallets_result.to_arrow(bqstorage_client=database.storage_client)
+                return arrow_table.to_pylist()
+            # bigquery.Row supports the same attribute/item access Jinja uses,
+            # so hand the rows to the template without rebuilding them as dicts
+            return list(wallets_result)
+
+        # The BigQuery client is synchronous; run the roundtrip on the
+        # dedicated pool instead of blocking the event loop
+        loop = asyncio.get_running_loop()
+        wallets = await loop.run_in_executor(BQ_EXECUTOR, fetch_wallets)
+
+        # Total count for pagination rides along on every row of the fused query
+        total_count = wallets[0]["total_count"] if wallets else 0
         
     except Exception as e:
         wallets = []
         total_count = 0
     
-    return templates.TemplateResponse("partials/wallet_list.html", {
+    # Stream the rendered table so bytes go out while later rows are still
+    # being rendered, instead of buffering the whole page string first
+    stream = templates.env.get_template("partials/wallet_list.html").stream({
         "request": request,
         "wallets": wallets,
         "total_count": total_count,
@@ -91,16 +115,26 @@ async def get_wallets_html(
         "has_previous": offset > 0,
         "has_next": offset + limit < total_count
     })
+    stream.enable_buffering(64)
+    return StreamingResponse(stream, media_type="text/html")
 
 @router.get("/wallets/search/by-address", response_class=HTMLResponse)
 async def search_wallet_html(
+    client: BQClient,
     request: Request,
-    address: str,
-    client: bigquery.Client = Depends(get_client)
+    address: str
 ):
     """Search wallet by address and return HTML"""
-    
+
     try:
+        # Serve repeat lookups for the same address from the TTL cache
+        cached = await get_cached_wallet_by_address(address)
+        if cached is not None:
+            return templates.TemplateResponse("partials/wallet_card.html", {
+                "request": request,
+                "wallet": cached
+            })
+
         search_query = f"""
             SELECT id, address, score, is_active, created_at, last_updated
             FROM `{settings.FULL_TABLE_ID}`
@@ -112,16 +146,14 @@ async def search_wallet_html(
             bigquery.ScalarQueryParameter("address", "STRING", address.lower())
         ])
         
-        result = client.query(search_query, job_config=job_config)
-        rows = list(result)
-        
-        if not rows:
+        rows = await run_query(client, search_query, job_config=job_config)
+        row = rows[0] if rows else None
+
+        if row is None:
             return templates.TemplateResponse("partials/wallet_not_found.html", {
                 "request": request,
                 "address": address
             })
-        
-        row = rows[0]
         wallet = {
             "id": row.id,
             "address": row.address,
@@ -130,7 +162,9 @@ async def search_wallet_html(
             "created_at": row.created_at,
             "last_updated": row.last_updated
         }
-        
+
+        await cache_wallet_by_address(address, wallet)
+
         return templates.TemplateResponse("partials/wallet_card.html", {
             "request": request,
             "wallet": wallet
@@ -166,10 +200,10 @@ async def login_page(request: Request):
 @router.post("/authenticate")
 async def authenticate(request: Request, password: str = Form(...)):
     """Handle login form submission"""
-    ADMIN_PASSWORD = getattr(settings, 'ADMIN_PASSWORD', 'admin123')  # Default password if not set
-    import secrets
-    
-    if secrets.compare_digest(password, ADMIN_PASSWORD):
+    # Compare fixed-size digests; the plaintext hash was computed at startup
+    submitted_hash = hashlib.sha256(password.encode()).digest()
+
+    if secrets.compare_digest(submitted_hash, settings.ADMIN_PASSWORD_HASH):
         # Set a session cookie and redirect
         response = RedirectResponse(url="/dashboard", status_code=302)
         # Create basic auth header for the session
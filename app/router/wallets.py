@@ -1,32 +1,144 @@
-from fastapi import APIRouter, HTTPException, Query, Depends
+from fastapi import APIRouter, HTTPException, Query
 from typing import List
 from datetime import datetime, timezone
 from google.cloud import bigquery
 from google.cloud.exceptions import NotFound
+import asyncio
+import logging
 import uuid
 
-from ..models import Wallet, WalletCreate, WalletUpdate
-from ..database import get_client
+from ..models import Wallet, WalletCreate, WalletUpdate, WalletList
+from ..database import BQClient, BQ_EXECUTOR, database, run_dml, run_query
 from ..config import settings
 from ..utils import (
-    validate_wallet_id, 
-    validate_ethereum_address, 
+    validate_wallet_id,
+    validate_ethereum_address,
     build_wallet_query_conditions,
-    build_sort_clause
+    build_sort_clause,
+    fetch_wallet_by_address,
+    fetch_wallet_by_id,
+    fetch_wallet_count,
+    invalidate_wallet_by_address,
+    invalidate_wallet_by_id,
+    invalidate_wallet_count
 )
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter(prefix="/wallets", tags=["wallets"])
 
-@router.get("/", response_model=List[Wallet])
+# Query texts built once at import; identical SQL across requests is what
+# lets BigQuery's server-side result cache actually hit
+_TBL = f"`{settings.FULL_TABLE_ID}`"
+_STATS_TBL = f"`{settings.FULL_STATS_TABLE_ID}`"
+_SELECT_COLS = "id, address, score, is_active, created_at, last_updated"
+
+_GET_WALLETS_SQL_TEMPLATE = f"""
+    SELECT {_SELECT_COLS},
+           COUNT(*) OVER () AS total_count
+    FROM {_TBL}
+    WHERE {{where}}
+    {{sort}}
+    LIMIT @limit OFFSET @offset
+"""
+
+_GET_COUNT_SQL = f"""
+    SELECT total AS count
+    FROM {_STATS_TBL}
+    WHERE name = 'wallets'
+"""
+
+_GET_BY_ID_SQL = f"""
+    SELECT {_SELECT_COLS}
+    FROM {_TBL}
+    WHERE id = @wallet_id
+    LIMIT 1
+"""
+
+_GET_BY_ADDRESS_SQL = f"""
+    SELECT {_SELECT_COLS}
+    FROM {_TBL}
+    WHERE address = @address
+    LIMIT 1
+"""
+
+_CREATE_MERGE_SQL = f"""
+    MERGE {_TBL} T
+    USING (SELECT @address AS address) S
+    ON T.address = S.address
+    WHEN NOT MATCHED THEN
+        INSERT ({_SELECT_COLS})
+        VALUES (@id, @address, @score, @is_active, @created_at, @last_updated)
+"""
+
+_BULK_MERGE_SQL = f"""
+    MERGE {_TBL} T
+    USING UNNEST(@rows) S
+    ON T.address = S.address
+    WHEN NOT MATCHED THEN
+        INSERT ({_SELECT_COLS})
+        VALUES (S.id, S.address, S.score, S.is_active, S.created_at, S.last_updated)
+"""
+
+_BULK_DUP_PROBE_SQL = f"""
+    SELECT address
+    FROM {_TBL}
+    WHERE address IN UNNEST(@addrs)
+    AND created_at < @batch_ts
+"""
+
+_DELETE_SQL = f"""
+    DELETE FROM {_TBL}
+    WHERE id = @wallet_id
+"""
+
+_ADJUST_TOTAL_SQL = f"""
+    UPDATE {_STATS_TBL}
+    SET total = total + @delta
+    WHERE name = 'wallets'
+"""
+
+def _query_config(params=None):
+    """QueryJobConfig with the result cache opted in explicitly"""
+    return bigquery.QueryJobConfig(
+        query_parameters=params or [],
+        use_query_cache=True,
+        use_legacy_sql=False,
+    )
+
+def _log_adjust_failure(future):
+    exc = future.exception()
+    if exc is not None:
+        logger.warning(f"wallet_stats counter update failed, total will drift until reconciled: {exc}")
+
+def _adjust_wallet_total(client: bigquery.Client, delta: int):
+    """Shift the denormalized wallet total after an insert or delete
+
+    Fire-and-forget from the handler's perspective: the job runs and is
+    awaited on the pool so the write endpoints don't pay a second
+    query-job roundtrip. Failures (BigQuery aborts concurrent single-row
+    DML regularly) are logged, and the periodic reconciler heals any
+    drift they leave behind.
+    """
+    job_config = _query_config([
+        bigquery.ScalarQueryParameter("delta", "INT64", delta)
+    ])
+
+    def _run():
+        client.query(_ADJUST_TOTAL_SQL, job_config=job_config).result()
+
+    BQ_EXECUTOR.submit(_run).add_done_callback(_log_adjust_failure)
+
+@router.get("/", response_model=WalletList)
 async def get_wallets(
+    client: BQClient,
     active_only: bool = Query(False, description="Filter for active wallets only"),
     min_score: int = Query(0, ge=0, le=10, description="Minimum score filter"),
     max_score: int = Query(10, ge=0, le=10, description="Maximum score filter"),
     limit: int = Query(100, ge=1, le=1000, description="Maximum number of results"),
     offset: int = Query(0, ge=0, description="Number of results to skip"),
     sort_by: str = Query("created_at", description="Sort field (created_at, score, address)"),
-    sort_order: int = Query(-1, description="Sort order: 1 for ascending, -1 for descending"),
-    client: bigquery.Client = Depends(get_client)
+    sort_order: int = Query(-1, description="Sort order: 1 for ascending, -1 for descending")
 ):
     """Get all wallets with optional filtering, sorting, and pagination"""
     
@@ -34,83 +146,74 @@ async def get_wallets(
     where_clause, params = build_wallet_query_conditions(active_only, min_score, max_score)
     sort_clause = build_sort_clause(sort_by, sort_order)
     
-    # Build final query
-    query = f"""
-        SELECT id, address, score, is_active, created_at, last_updated
-        FROM `{settings.FULL_TABLE_ID}`
-        WHERE {where_clause}
-        {sort_clause}
-        LIMIT @limit OFFSET @offset
-    """
-    
-    # Add pagination parameters
-    params["limit"] = limit
-    params["offset"] = offset
-    
-    # Fix: Properly build query parameters
-    query_params = []
-    for name, value in params.items():
-        if isinstance(value, int):
-            query_params.append(bigquery.ScalarQueryParameter(name, "INT64", value))
-        elif isinstance(value, bool):
-            query_params.append(bigquery.ScalarQueryParameter(name, "BOOL", value))
-        else:
-            query_params.append(bigquery.ScalarQueryParameter(name, "STRING", str(value)))
-    
-    job_config = bigquery.QueryJobConfig(query_parameters=query_params)
-    
+    # COUNT(*) OVER () returns the total matching the filter from the same
+    # scan, so list and count share one query job
+    query = _GET_WALLETS_SQL_TEMPLATE.format(where=where_clause, sort=sort_clause)
+
+    # Add pagination parameters; everything is already typed at the source
+    params.append(bigquery.ScalarQueryParameter("limit", "INT64", limit))
+    params.append(bigquery.ScalarQueryParameter("offset", "INT64", offset))
+
+    job_config = _query_config(params)
+
+    def fetch_rows():
+        result = client.query(query, job_config=job_config).result()
+        if database.storage_client is not None:
+            # Download the page as Arrow columnar batches and convert in
+            # bulk, instead of decoding rows one by one over REST
+            return result.to_arrow(bqstorage_client=database.storage_client).to_pylist()
+        return [dict(row) for row in result]
+
     try:
-        results = client.query(query, job_config=job_config)
-        wallets = [Wallet.from_bigquery_row(row) for row in results]
-        return wallets
+        loop = asyncio.get_running_loop()
+        rows = await loop.run_in_executor(BQ_EXECUTOR, fetch_rows)
+        # Trusted DB output: model_construct skips per-row revalidation
+        # (the extra total_count key is ignored)
+        wallets = [Wallet.model_construct(**row) for row in rows]
+        total_count = rows[0]["total_count"] if rows else 0
+        return WalletList(wallets=wallets, total_count=total_count)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Query failed: {str(e)}")
 
 @router.get("/count")
 async def get_wallet_count(
-    client: bigquery.Client = Depends(get_client)
+    client: BQClient
 ):
     """Get the total number of wallets in the table"""
-    
-    query = f"""
-        SELECT COUNT(*) as count
-        FROM `{settings.FULL_TABLE_ID}`
-    """
-    
+
+    async def fetch():
+        # Read the maintained counter row, not a COUNT(*) scan
+        results = await run_query(client, _GET_COUNT_SQL, _query_config())
+        return next(iter(results)).count
+
     try:
-        results = client.query(query)
-        count = list(results)[0].count
-        return count
+        return await fetch_wallet_count(fetch)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Query failed: {str(e)}")
     
 @router.get("/{wallet_id}", response_model=Wallet)
 async def get_wallet(
-    wallet_id: str, 
-    client: bigquery.Client = Depends(get_client)
+    client: BQClient,
+    wallet_id: str
 ):
     """Get a specific wallet by ID"""
     validated_id = validate_wallet_id(wallet_id)
-    
-    query = f"""
-        SELECT id, address, score, is_active, created_at, last_updated
-        FROM `{settings.FULL_TABLE_ID}`
-        WHERE id = @wallet_id
-        LIMIT 1
-    """
-    
-    job_config = bigquery.QueryJobConfig(query_parameters=[
+
+    job_config = _query_config([
         bigquery.ScalarQueryParameter("wallet_id", "STRING", validated_id)
     ])
-    
-    try:
-        results = client.query(query, job_config=job_config)
-        rows = list(results)
-        
-        if not rows:
+
+    async def fetch():
+        results = await run_query(client, _GET_BY_ID_SQL, job_config)
+        row = next(iter(results), None)
+
+        if row is None:
             raise HTTPException(status_code=404, detail="Wallet not found")
-        
-        return Wallet.from_bigquery_row(rows[0])
+
+        return Wallet.from_bigquery_row(row)
+
+    try:
+        return await fetch_wallet_by_id(validated_id, fetch)
     except HTTPException:
         raise
     except Exception as e:
@@ -118,31 +221,29 @@ async def get_wallet(
 
 @router.get("/search/by-address", response_model=Wallet)  # Fix: Added response model
 async def search_wallet_by_address(
-    address: str = Query(..., min_length=42, max_length=42),
-    client: bigquery.Client = Depends(get_client)
+    client: BQClient,
+    address: str = Query(..., min_length=42, max_length=42)
 ):
     """Search for a wallet by address"""
     validated_address = validate_ethereum_address(address)
-    
-    query = f"""
-        SELECT id, address, score, is_active, created_at, last_updated
-        FROM `{settings.FULL_TABLE_ID}`
-        WHERE address = @address
-        LIMIT 1
-    """
-    
-    job_config = bigquery.QueryJobConfig(query_parameters=[
+
+    job_config = _query_config([
         bigquery.ScalarQueryParameter("address", "STRING", validated_address)
     ])
-    
-    try:
-        results = client.query(query, job_config=job_config)
-        rows = list(results)
-        
-        if not rows:
+
+    async def fetch():
+        results = await run_query(client, _GET_BY_ADDRESS_SQL, job_config)
+        row = next(iter(results), None)
+
+        if row is None:
             raise HTTPException(status_code=404, detail="Wallet not found")
-        
-        return Wallet.from_bigquery_row(rows[0])
+
+        return Wallet.from_bigquery_row(row).model_dump()
+
+    try:
+        # Cached as a dict so the HTML search route can share the entries;
+        # the dict came from our own model_dump, so skip revalidation
+        return Wallet.model_construct(**await fetch_wallet_by_address(validated_address, fetch))
     except HTTPException:
         raise
     except Exception as e:
@@ -150,53 +251,39 @@ async def search_wallet_by_address(
 
 @router.post("/", response_model=Wallet, status_code=201)
 async def create_wallet(
-    wallet_data: WalletCreate, 
-    client: bigquery.Client = Depends(get_client)
+    client: BQClient,
+    wallet_data: WalletCreate
 ):
     """Create a new wallet entry"""
-    
+
     # Validate address format
     validated_address = validate_ethereum_address(wallet_data.address)
-    
-    # Check if wallet address already exists
-    check_query = f"""
-        SELECT COUNT(*) as count
-        FROM `{settings.FULL_TABLE_ID}`
-        WHERE address = @address
-    """
-    
-    job_config = bigquery.QueryJobConfig(query_parameters=[
-        bigquery.ScalarQueryParameter("address", "STRING", validated_address)
+
+    wallet_id = str(uuid.uuid4())
+    now = datetime.now(timezone.utc)
+
+    # _CREATE_MERGE_SQL inserts only when the address is absent, so the
+    # duplicate check and the insert are one atomic query job with no
+    # check-then-insert race
+    job_config = _query_config([
+        bigquery.ScalarQueryParameter("id", "STRING", wallet_id),
+        bigquery.ScalarQueryParameter("address", "STRING", validated_address),
+        bigquery.ScalarQueryParameter("score", "INT64", wallet_data.score),
+        bigquery.ScalarQueryParameter("is_active", "BOOL", wallet_data.is_active),
+        bigquery.ScalarQueryParameter("created_at", "TIMESTAMP", now),
+        bigquery.ScalarQueryParameter("last_updated", "TIMESTAMP", now),
     ])
-    
+
     try:
-        results = client.query(check_query, job_config=job_config)
-        count = list(results)[0].count
-        
-        if count > 0:
+        job = await run_dml(client, _CREATE_MERGE_SQL, job_config)
+
+        if job.num_dml_affected_rows == 0:
             raise HTTPException(status_code=400, detail="Wallet address already exists")
-        
-        # Create new wallet
-        wallet_id = str(uuid.uuid4())
-        now = datetime.now(timezone.utc)
-        
-        insert_query = f"""
-            INSERT INTO `{settings.FULL_TABLE_ID}` 
-            (id, address, score, is_active, created_at, last_updated)
-            VALUES (@id, @address, @score, @is_active, @created_at, @last_updated)
-        """
-        
-        job_config = bigquery.QueryJobConfig(query_parameters=[
-            bigquery.ScalarQueryParameter("id", "STRING", wallet_id),
-            bigquery.ScalarQueryParameter("address", "STRING", validated_address),
-            bigquery.ScalarQueryParameter("score", "INT64", wallet_data.score),
-            bigquery.ScalarQueryParameter("is_active", "BOOL", wallet_data.is_active),
-            bigquery.ScalarQueryParameter("created_at", "TIMESTAMP", now),
-            bigquery.ScalarQueryParameter("last_updated", "TIMESTAMP", now),
-        ])
-        
-        client.query(insert_query, job_config=job_config).result()
-        
+
+        _adjust_wallet_total(client, 1)
+        await invalidate_wallet_by_address(validated_address)
+        await invalidate_wallet_count()
+
         # Return the created wallet
         return Wallet(
             id=wallet_id,
@@ -214,73 +301,64 @@ async def create_wallet(
 
 @router.put("/{wallet_id}", response_model=Wallet)
 async def update_wallet(
+    client: BQClient,
     wallet_id: str, 
-    wallet_update: WalletUpdate, 
-    client: bigquery.Client = Depends(get_client)
+    wallet_update: WalletUpdate
 ):
     """Update an existing wallet"""
     validated_id = validate_wallet_id(wallet_id)
-    
-    # Check if wallet exists
-    check_query = f"""
-        SELECT id, address, score, is_active, created_at, last_updated
-        FROM `{settings.FULL_TABLE_ID}`
-        WHERE id = @wallet_id
-        LIMIT 1
-    """
-    
-    job_config = bigquery.QueryJobConfig(query_parameters=[
-        bigquery.ScalarQueryParameter("wallet_id", "STRING", validated_id)
-    ])
-    
+
+    id_param = bigquery.ScalarQueryParameter("wallet_id", "STRING", validated_id)
+
+    # Build update query dynamically
+    update_fields = []
+    params = [id_param]
+
+    if wallet_update.score is not None:
+        update_fields.append("score = @new_score")
+        params.append(bigquery.ScalarQueryParameter("new_score", "INT64", wallet_update.score))
+
+    if wallet_update.is_active is not None:
+        update_fields.append("is_active = @new_is_active")
+        params.append(bigquery.ScalarQueryParameter("new_is_active", "BOOL", wallet_update.is_active))
+
     try:
-        results = client.query(check_query, job_config=job_config)
-        rows = list(results)
-        
-        if not rows:
+        if update_fields:
+            # UPDATE straight away; num_dml_affected_rows tells us whether
+            # the wallet existed, so no pre-SELECT existence check is needed
+            now = datetime.now(timezone.utc)
+            update_fields.append("last_updated = @last_updated")
+            params.append(bigquery.ScalarQueryParameter("last_updated", "TIMESTAMP", now))
+
+            # The SET list varies with the provided fields, so this is the
+            # one query text still built per request
+            update_query = f"""
+                UPDATE {_TBL}
+                SET {', '.join(update_fields)}
+                WHERE id = @wallet_id
+            """
+
+            job = await run_dml(client, update_query, _query_config(params))
+
+            if job.num_dml_affected_rows == 0:
+                raise HTTPException(status_code=404, detail="Wallet not found")
+
+        # Read back the (possibly updated) row for the response; this also
+        # supplies the address for the cache invalidation below
+        results = await run_query(client, _GET_BY_ID_SQL, _query_config([id_param]))
+        row = next(iter(results), None)
+
+        if row is None:
             raise HTTPException(status_code=404, detail="Wallet not found")
-        
-        existing_wallet = rows[0]
-        
-        # Build update query dynamically
-        update_fields = []
-        params = [bigquery.ScalarQueryParameter("wallet_id", "STRING", validated_id)]
-        
-        if wallet_update.score is not None:
-            update_fields.append("score = @new_score")
-            params.append(bigquery.ScalarQueryParameter("new_score", "INT64", wallet_update.score))
-        
-        if wallet_update.is_active is not None:
-            update_fields.append("is_active = @new_is_active")
-            params.append(bigquery.ScalarQueryParameter("new_is_active", "BOOL", wallet_update.is_active))
-        
-        if not update_fields:
-            # No fields to update, return existing wallet
-            return Wallet.from_bigquery_row(existing_wallet)
-        
-        now = datetime.now(timezone.utc)
-        update_fields.append("last_updated = @last_updated")
-        params.append(bigquery.ScalarQueryParameter("last_updated", "TIMESTAMP", now))
-        
-        update_query = f"""
-            UPDATE `{settings.FULL_TABLE_ID}`
-            SET {', '.join(update_fields)}
-            WHERE id = @wallet_id
-        """
-        
-        job_config = bigquery.QueryJobConfig(query_parameters=params)
-        client.query(update_query, job_config=job_config).result()
-        
-        # Return updated wallet
-        updated_wallet = Wallet.from_bigquery_row(existing_wallet)
-        if wallet_update.score is not None:
-            updated_wallet.score = wallet_update.score
-        if wallet_update.is_active is not None:
-            updated_wallet.is_active = wallet_update.is_active
-        updated_wallet.last_updated = now
-        
+
+        updated_wallet = Wallet.from_bigquery_row(row)
+
+        if update_fields:
+            await invalidate_wallet_by_address(updated_wallet.address)
+            await invalidate_wallet_by_id(validated_id)
+
         return updated_wallet
-    
+
     except HTTPException:
         raise
     except Exception as e:
@@ -288,41 +366,33 @@ async def update_wallet(
 
 @router.delete("/{wallet_id}")
 async def delete_wallet(
-    wallet_id: str, 
-    client: bigquery.Client = Depends(get_client)
+    client: BQClient,
+    wallet_id: str
 ):
     """Delete a wallet"""
     validated_id = validate_wallet_id(wallet_id)
     
     # First get the wallet to return in response
-    get_query = f"""
-        SELECT id, address, score, is_active, created_at, last_updated
-        FROM `{settings.FULL_TABLE_ID}`
-        WHERE id = @wallet_id
-        LIMIT 1
-    """
-    
-    job_config = bigquery.QueryJobConfig(query_parameters=[
+    job_config = _query_config([
         bigquery.ScalarQueryParameter("wallet_id", "STRING", validated_id)
     ])
     
     try:
-        results = client.query(get_query, job_config=job_config)
-        rows = list(results)
-        
-        if not rows:
+        results = await run_query(client, _GET_BY_ID_SQL, job_config)
+        row = next(iter(results), None)
+
+        if row is None:
             raise HTTPException(status_code=404, detail="Wallet not found")
-        
-        wallet = Wallet.from_bigquery_row(rows[0])
-        
-        # Delete the wallet
-        delete_query = f"""
-            DELETE FROM `{settings.FULL_TABLE_ID}`
-            WHERE id = @wallet_id
-        """
-        
-        client.query(delete_query, job_config=job_config).result()
-        
+
+        wallet = Wallet.from_bigquery_row(row)
+
+        await run_dml(client, _DELETE_SQL, job_config)
+
+        _adjust_wallet_total(client, -1)
+        await invalidate_wallet_by_address(wallet.address)
+        await invalidate_wallet_by_id(validated_id)
+        await invalidate_wallet_count()
+
         return {
             "message": "Wallet deleted successfully",
             "deleted_wallet": wallet
@@ -335,8 +405,8 @@ async def delete_wallet(
 
 @router.post("/bulk", status_code=201)
 async def bulk_create_wallets(
-    wallets: List[WalletCreate], 
-    client: bigquery.Client = Depends(get_client)
+    client: BQClient,
+    wallets: List[WalletCreate]
 ):
     """Bulk create multiple wallets"""
     if len(wallets) > 100:
@@ -348,63 +418,82 @@ async def bulk_create_wallets(
         validated_address = validate_ethereum_address(wallet_data.address)
         validated_addresses.append(validated_address)
     
-    # Check for existing addresses
-    if validated_addresses:
-        placeholders = ','.join([f'@addr_{i}' for i in range(len(validated_addresses))])
-        check_query = f"""
-            SELECT address
-            FROM `{settings.FULL_TABLE_ID}`
-            WHERE address IN ({placeholders})
-        """
-        
-        params = [
-            bigquery.ScalarQueryParameter(f"addr_{i}", "STRING", addr)
-            for i, addr in enumerate(validated_addresses)
-        ]
-        
-        job_config = bigquery.QueryJobConfig(query_parameters=params)
-        
-        try:
-            results = client.query(check_query, job_config=job_config)
+    if not validated_addresses:
+        return {"message": "No wallets to insert", "inserted_ids": []}
+
+    # Prepare bulk insert
+    now = datetime.now(timezone.utc)
+    rows_to_insert = []
+
+    for i, wallet_data in enumerate(wallets):
+        rows_to_insert.append({
+            "id": str(uuid.uuid4()),
+            "address": validated_addresses[i],
+            "score": wallet_data.score,
+            "is_active": wallet_data.is_active,
+            "created_at": now,
+            "last_updated": now
+        })
+
+    # _BULK_MERGE_SQL handles the whole batch: dedupe against existing
+    # addresses and insert the rest atomically, instead of a SELECT ... IN
+    # probe followed by a separate insert (two roundtrips plus a
+    # check-then-insert race)
+    rows_param = bigquery.ArrayQueryParameter("rows", "STRUCT", [
+        bigquery.StructQueryParameter(
+            None,
+            bigquery.ScalarQueryParameter("id", "STRING", row["id"]),
+            bigquery.ScalarQueryParameter("address", "STRING", row["address"]),
+            bigquery.ScalarQueryParameter("score", "INT64", row["score"]),
+            bigquery.ScalarQueryParameter("is_active", "BOOL", row["is_active"]),
+            bigquery.ScalarQueryParameter("created_at", "TIMESTAMP", row["created_at"]),
+            bigquery.ScalarQueryParameter("last_updated", "TIMESTAMP", row["last_updated"]),
+        )
+        for row in rows_to_insert
+    ])
+
+    job_config = _query_config([rows_param])
+
+    try:
+        job = await run_dml(client, _BULK_MERGE_SQL, job_config)
+        inserted_count = job.num_dml_affected_rows or 0
+
+        _adjust_wallet_total(client, inserted_count)
+        await invalidate_wallet_count()
+
+        if inserted_count < len(rows_to_insert):
+            # Some addresses were already present; look them up so the
+            # response can say which rows were skipped. Rows created before
+            # this batch's timestamp are the pre-existing duplicates. One
+            # array parameter keeps the query text constant across batch
+            # sizes, so BigQuery can cache the plan and result
+            params = [
+                bigquery.ArrayQueryParameter("addrs", "STRING", validated_addresses),
+                bigquery.ScalarQueryParameter("batch_ts", "TIMESTAMP", now),
+            ]
+
+            results = await run_query(client, _BULK_DUP_PROBE_SQL, _query_config(params))
             existing_addresses = {row.address for row in results}
-            
-            # Check if any addresses already exist
-            for addr in validated_addresses:
-                if addr in existing_addresses:
-                    raise HTTPException(
-                        status_code=400,
-                        detail=f"Wallet address already exists: {addr}"
-                    )
-            
-            # Prepare bulk insert
-            now = datetime.now(timezone.utc)
-            rows_to_insert = []
-            
-            for i, wallet_data in enumerate(wallets):
-                rows_to_insert.append({
-                    "id": str(uuid.uuid4()),
-                    "address": validated_addresses[i],
-                    "score": wallet_data.score,
-                    "is_active": wallet_data.is_active,
-                    "created_at": now,
-                    "last_updated": now
-                })
-            
-            # Insert rows
-            table = client.get_table(settings.FULL_TABLE_ID)
-            errors = client.insert_rows_json(table, rows_to_insert)
-            
-            if errors:
-                raise HTTPException(status_code=500, detail=f"Insert errors: {errors}")
-            
+
+            # One C-level intersection reports every conflict at once
+            duplicates = existing_addresses.intersection(validated_addresses)
+
+            inserted_ids = [
+                row["id"] for row in rows_to_insert
+                if row["address"] not in duplicates
+            ]
             return {
-                "message": f"Successfully created {len(rows_to_insert)} wallets",
-                "inserted_ids": [row["id"] for row in rows_to_insert]
+                "message": f"Created {inserted_count} wallets, {len(duplicates)} already existed",
+                "inserted_ids": inserted_ids,
+                "duplicate_addresses": sorted(duplicates)
             }
-        
-        except HTTPException:
-            raise
-        except Exception as e:
-            raise HTTPException(status_code=500, detail=f"Bulk insert failed: {str(e)}")
-    
-    return {"message": "No wallets to insert", "inserted_ids": []}
\ No newline at end of file
+
+        return {
+            "message": f"Successfully created {len(rows_to_insert)} wallets",
+            "inserted_ids": [row["id"] for row in rows_to_insert]
+        }
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Bulk insert failed: {str(e)}")
\ No newline at end of file
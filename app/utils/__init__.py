@@ -1,3 +1,26 @@
 from .helpers import validate_wallet_id, validate_ethereum_address, build_wallet_query_conditions, build_sort_clause
+from .cache import (
+    get_cached_wallet_by_address,
+    cache_wallet_by_address,
+    invalidate_wallet_by_address,
+    fetch_wallet_by_address,
+    fetch_wallet_by_id,
+    invalidate_wallet_by_id,
+    fetch_wallet_count,
+    invalidate_wallet_count,
+)
 
-__all__ = ["validate_wallet_id", "validate_ethereum_address", "build_wallet_query_conditions", "build_sort_clause"]
\ No newline at end of file
+__all__ = [
+    "validate_wallet_id",
+    "validate_ethereum_address",
+    "build_wallet_query_conditions",
+    "build_sort_clause",
+    "get_cached_wallet_by_address",
+    "cache_wallet_by_address",
+    "invalidate_wallet_by_address",
+    "fetch_wallet_by_address",
+    "fetch_wallet_by_id",
+    "invalidate_wallet_by_id",
+    "fetch_wallet_count",
+    "invalidate_wallet_count",
+]
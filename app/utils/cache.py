@@ -0,0 +1,80 @@
+import asyncio
+from collections import defaultdict
+from cachetools import TTLCache
+
+# Short-lived caches for the read endpoints. Each GET otherwise spawns a
+# BigQuery query job with hundreds of ms of fixed overhead, so repeat
+# lookups from the UI are served in-process instead. Writes invalidate the
+# affected keys, so the TTLs only bound staleness across processes.
+_address_cache = TTLCache(maxsize=4096, ttl=30)
+_wallet_cache = TTLCache(maxsize=10_000, ttl=30)
+_count_cache = TTLCache(maxsize=1, ttl=60)
+
+# One lock per cache key so concurrent identical misses run the query once
+# and the rest wait for the cached result instead of stampeding BigQuery
+_key_locks = defaultdict(asyncio.Lock)
+
+_COUNT_KEY = "wallets:count"
+
+async def cached_fetch(cache: TTLCache, key, fetch):
+    """Return cache[key], calling fetch() once on a miss
+
+    Concurrent misses for the same key are coalesced behind a per-key lock:
+    the first caller runs fetch, later callers find the fresh cache entry.
+    None results are not cached.
+    """
+    value = cache.get(key)
+    if value is not None:
+        return value
+
+    lock = _key_locks[key]
+    try:
+        async with lock:
+            value = cache.get(key)
+            if value is not None:
+                return value
+
+            value = await fetch()
+            if value is not None:
+                cache[key] = value
+            return value
+    finally:
+        # Keys are client-supplied, so drop the lock entry once no one
+        # holds it or the dict would grow without bound. The checks run
+        # without an await in between, so they are atomic on the loop; a
+        # miss racing the eviction just allocates a fresh lock and may run
+        # fetch a second time, which is harmless
+        if not lock.locked() and _key_locks.get(key) is lock:
+            del _key_locks[key]
+
+async def get_cached_wallet_by_address(address: str):
+    """Return the cached wallet dict for an address, or None on a miss"""
+    return _address_cache.get(address.lower())
+
+async def cache_wallet_by_address(address: str, wallet: dict):
+    """Store a wallet dict under its normalized address"""
+    _address_cache[address.lower()] = wallet
+
+async def invalidate_wallet_by_address(address: str):
+    """Drop a cached address entry after a write to that wallet"""
+    _address_cache.pop(address.lower(), None)
+
+async def fetch_wallet_by_address(address: str, fetch):
+    """Address lookup through the cache, coalescing concurrent misses"""
+    return await cached_fetch(_address_cache, address.lower(), fetch)
+
+async def fetch_wallet_by_id(wallet_id: str, fetch):
+    """Wallet-id lookup through the cache, coalescing concurrent misses"""
+    return await cached_fetch(_wallet_cache, wallet_id, fetch)
+
+async def invalidate_wallet_by_id(wallet_id: str):
+    """Drop a cached id entry after a write to that wallet"""
+    _wallet_cache.pop(wallet_id, None)
+
+async def fetch_wallet_count(fetch):
+    """Total wallet count through the cache"""
+    return await cached_fetch(_count_cache, _COUNT_KEY, fetch)
+
+async def invalidate_wallet_count():
+    """Drop the cached total after any insert or delete"""
+    _count_cache.pop(_COUNT_KEY, None)
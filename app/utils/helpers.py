@@ -1,45 +1,58 @@
 from fastapi import HTTPException
-import uuid
+from google.cloud import bigquery
 import re
 
+# 256-byte table mapping hex-digit bytes to 0 and everything else to 1, so
+# checking an address body is one C-level translate + count instead of a
+# regex engine pass
+_NON_HEX_TABLE = bytes(0 if chr(c) in "0123456789abcdefABCDEF" else 1 for c in range(256))
+
+# Shape of the canonical UUID string; the value is only ever passed on as a
+# STRING query parameter, so a pattern check replaces building a UUID object
+_UUID_RE = re.compile(r"\A[0-9a-f]{8}-[0-9a-f]{4}-[1-5][0-9a-f]{3}-[89ab][0-9a-f]{3}-[0-9a-f]{12}\Z", re.I)
+
 def validate_wallet_id(id_string: str) -> str:
     """Validate wallet ID format (UUID)"""
-    try:
-        uuid.UUID(id_string)
-        return id_string
-    except ValueError:
+    if _UUID_RE.match(id_string) is None:
         raise HTTPException(status_code=400, detail="Invalid wallet ID format")
+    return id_string
 
 def validate_ethereum_address(address: str) -> str:
     """Validate Ethereum address format"""
-    if not address.startswith('0x') or len(address) != 42:
-        raise HTTPException(status_code=400, detail="Invalid Ethereum address format")
-    
-    # Check if it contains only valid hex characters
-    if not re.match(r'^0x[a-fA-F0-9]{40}$', address):
-        raise HTTPException(status_code=400, detail="Invalid Ethereum address format")
-    
-    return address.lower()
+    if len(address) == 42 and address.startswith("0x"):
+        try:
+            body = address.encode("ascii")
+        except UnicodeEncodeError:
+            body = None
+
+        if body is not None and 1 not in body[2:].translate(_NON_HEX_TABLE):
+            return address.lower()
+
+    raise HTTPException(status_code=400, detail="Invalid Ethereum address format")
 
 def build_wallet_query_conditions(
     active_only: bool = False,
     min_score: int = 0,
     max_score: int = 10
-) -> tuple[str, dict]:
-    """Build SQL WHERE conditions and parameters for wallet queries"""
+) -> tuple[str, list]:
+    """Build SQL WHERE conditions and typed query parameters for wallet queries
+
+    Parameters carry their BigQuery type from the start, so callers don't
+    have to re-derive it by reflecting on Python types per request.
+    """
     conditions = []
-    params = {}
-    
+    params = []
+
     # Score range filter
     conditions.append("score >= @min_score AND score <= @max_score")
-    params["min_score"] = min_score
-    params["max_score"] = max_score
-    
+    params.append(bigquery.ScalarQueryParameter("min_score", "INT64", min_score))
+    params.append(bigquery.ScalarQueryParameter("max_score", "INT64", max_score))
+
     # Active filter
     if active_only:
         conditions.append("is_active = @is_active")
-        params["is_active"] = True
-    
+        params.append(bigquery.ScalarQueryParameter("is_active", "BOOL", True))
+
     where_clause = " AND ".join(conditions) if conditions else "1=1"
     return where_clause, params
 
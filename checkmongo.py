@@ -30,34 +30,43 @@ async def check_database():
         server_info = await client.server_info()
         print(f"MongoDB Version: {server_info.get('version', 'Unknown')}")
         
-        # Count documents
-        total_count = await collection.count_documents({})
+        # One $facet aggregation returns the total, a sample and the
+        # frontend-filter count in a single round-trip instead of three
+        pipeline = [{"$facet": {
+            "total": [{"$count": "n"}],
+            "sample": [{"$limit": 3}],
+            "filtered": [
+                {"$match": {"score": {"$gte": 0, "$lte": 10}}},
+                {"$count": "n"}
+            ]
+        }}]
+        facets = await collection.aggregate(pipeline).next()
+
+        total_count = facets["total"][0]["n"] if facets["total"] else 0
         print(f"Total wallets in collection: {total_count}")
-        
+
         if total_count == 0:
             print("\n❌ No wallets found in the collection!")
             print("This is why your frontend shows 'No wallets found'")
-            
+
             # Ask to create sample data
             create_sample = input("\nWould you like to create sample wallet data? (y/n): ")
             if create_sample.lower() == 'y':
                 await create_sample_data(collection)
         else:
             print("\n✅ Found wallet data!")
-            
+
             # Show sample data
-            sample_wallets = await collection.find({}).limit(3).to_list(length=3)
             print("\nSample wallets:")
-            for i, wallet in enumerate(sample_wallets, 1):
+            for i, wallet in enumerate(facets["sample"], 1):
                 print(f"{i}. Address: {wallet.get('address', 'N/A')[:20]}...")
                 print(f"   Score: {wallet.get('score', 'N/A')}")
                 print(f"   Active: {wallet.get('is_active', 'N/A')}")
                 print()
-        
-        # Test the specific query your frontend uses
+
+        # The frontend's score filter, counted in the same aggregation
         print("Testing frontend query...")
-        frontend_query = {"score": {"$gte": 0, "$lte": 10}}
-        frontend_count = await collection.count_documents(frontend_query)
+        frontend_count = facets["filtered"][0]["n"] if facets["filtered"] else 0
         print(f"Wallets matching frontend filter: {frontend_count}")
         
         client.close()
@@ -72,29 +81,32 @@ async def check_database():
 
 async def create_sample_data(collection):
     """Create sample wallet data for testing"""
-    from datetime import datetime
-    
+    from datetime import datetime, timezone
+
+    # utcnow() is deprecated and naive; compute one tz-aware timestamp per batch
+    now = datetime.now(timezone.utc)
+
     sample_wallets = [
         {
             "address": "0x1234567890123456789012345678901234567890",
             "score": 8,
             "is_active": True,
-            "created_at": datetime.utcnow(),
-            "last_updated": datetime.utcnow()
+            "created_at": now,
+            "last_updated": now
         },
         {
             "address": "0xabcdefabcdefabcdefabcdefabcdefabcdefabcd",
             "score": 6,
             "is_active": True,
-            "created_at": datetime.utcnow(),
-            "last_updated": datetime.utcnow()
+            "created_at": now,
+            "last_updated": now
         },
         {
             "address": "0x9876543210987654321098765432109876543210",
             "score": 4,
             "is_active": False,
-            "created_at": datetime.utcnow(),
-            "last_updated": datetime.utcnow()
+            "created_at": now,
+            "last_updated": now
         }
     ]
     